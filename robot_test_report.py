@@ -1,755 +1,105 @@
 #!/usr/bin/env python3
 
+import io
+import os
 import sys
+import re
 import json
-from robot.api import ExecutionResult
-
-def extract_keywords(item, html_lines, indent=0, is_setup=False, is_teardown=False):
-    """Extract keywords from an item, handling nested structures."""
-    # Skip items marked as NOT RUN
-    if hasattr(item, 'status') and item.status == 'NOT RUN':
-        return
-
-    # Handle different types of items
-    if hasattr(item, 'type'):
-        if item.type in ['KEYWORD', 'SETUP', 'TEARDOWN']:
-            # Handle all keywords, including setup and teardown
-            keyword_name = getattr(item, 'kwname', '')
-            if not keyword_name or keyword_name.startswith('$'):
-                return
-
-            # Get tags for the keyword
-            tags = []
-            if hasattr(item, 'tags'):
-                tags = item.tags
-
-            # Check if the keyword has user_defined tag
-            has_user_defined_tag = False
-            for tag in tags:
-                if tag.lower() == 'user_defined':
-                    has_user_defined_tag = True
-                    break
-
-            if not has_user_defined_tag:
-                return
-
-            # Use the complete keyword name
-            keyword_name = keyword_name.split('  ')[0]
-
-            if hasattr(item, 'body') and item.body:
-                # If keyword has nested keywords, make it foldable
-                keyword_class = ""
-                if is_setup:
-                    keyword_class = "setup-keyword"
-                elif is_teardown:
-                    keyword_class = "teardown-keyword"
-
-                html_lines.append(f"<li class='{keyword_class}' data-tags='{' '.join(tags)}'>{keyword_name}")
-                html_lines.append("<ul>")
-                for nested_item in item.body:
-                    extract_keywords(nested_item, html_lines, indent + 1, is_setup, is_teardown)
-                html_lines.append("</ul>")
-                html_lines.append("</li>")
-            else:
-                # If no nested keywords, display as a simple list item
-                keyword_class = ""
-                if is_setup:
-                    keyword_class = "setup-keyword"
-                elif is_teardown:
-                    keyword_class = "teardown-keyword"
-
-                html_lines.append(f"<li class='{keyword_class}' data-tags='{' '.join(tags)}'>{keyword_name}</li>")
-
-    # Process nested items
-    if hasattr(item, 'body'):
-        for nested_item in item.body:
-            extract_keywords(nested_item, html_lines, indent + 1, is_setup, is_teardown)
-
-def process_suite(suite, html_lines, processed_tests=None):
-    """Process a test suite and its contents."""
-    if processed_tests is None:
-        processed_tests = set()
-
-    html_lines.append(f"""
+from collections import Counter
+from functools import lru_cache
+import shutil
+import hashlib
+import time
+from html import escape
+from xml.etree.ElementTree import iterparse
+
+# Reports are cached under $XDG_CACHE_HOME (~/.cache by default) unless
+# RBF_REPORT_NO_CACHE is set to a non-empty value
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'rbf_report')
+NO_CACHE_ENV = 'RBF_REPORT_NO_CACHE'
+OUTPUT_HTML = 'test_suite_overview.html'
+# Number of reports kept in the cache; the least recently used ones are removed
+CACHE_MAX_ENTRIES = 20
+
+# Item types and statuses checked for every node of the result tree
+KEYWORD_TYPES = frozenset({'KEYWORD', 'SETUP', 'TEARDOWN'})
+NOT_RUN = sys.intern('NOT RUN')
+
+# Keywords carrying this tag (in any case) are shown in the report
+USER_DEFINED_TAG = 'user_defined'
+
+# Keyword names are cut at the first double space
+NAME_SEPARATOR = '  '
+
+# Body item types of the output.xml elements that carry no type attribute
+BODY_ELEMENT_TYPES = {
+    'for': 'FOR',
+    'iter': 'ITERATION',
+    'if': 'IF/ELSE ROOT',
+    'try': 'TRY/EXCEPT ROOT',
+    'while': 'WHILE',
+    'group': 'GROUP',
+    'variable': 'VAR',
+    'return': 'RETURN',
+    'continue': 'CONTINUE',
+    'break': 'BREAK',
+    'error': 'ERROR',
+    'msg': 'MESSAGE',
+}
+
+# Static HTML blocks of the suite tree, written around the names
+SUITE_OPEN_START = """
         <div class="test-suite">
             <div class="suite-header" aria-expanded="false">
                 <div>
-                    <div class="suite-name">Suite: {suite.name}</div>
+                    <div class="suite-name">Suite: """
+SUITE_OPEN_END = """</div>
                 </div>
                 <span class="chevron">▸</span>
             </div>
-            <div class="suite-content">""")
-
-    # Process suite setup
-    if hasattr(suite, 'setup') and suite.setup:
-        html_lines.append("""
-                <div class="test-case">
-                    <div class="test-name">Suite Setup</div>
-                    <div class="keywords">""")
-        extract_keywords(suite.setup, html_lines, is_setup=True)
-        html_lines.append("""
-                    </div>
-                </div>""")
-
-    # Process nested suites
-    for subsuite in suite.suites:
-        process_suite(subsuite, html_lines, processed_tests)
-
-    # Process test cases
-    for test in suite.tests:
-        # Skip if we've already processed this test
-        test_id = f"{suite.name}.{test.name}"
-        if test_id in processed_tests:
-            continue
-        processed_tests.add(test_id)
-
-        html_lines.append(f"""
-                <div class="test-case">
-                    <div class="test-name">Test Case: {test.name}</div>
-                    <div class="keywords">""")
-
-        # Process test setup
-        if hasattr(test, 'setup') and test.setup:
-            html_lines.append("""
-                        <div class="test-case">
-                            <div class="test-name">Test Setup</div>
-                            <div class="keywords">""")
-            extract_keywords(test.setup, html_lines, is_setup=True)
-            html_lines.append("""
-                            </div>
-                        </div>""")
-
-        # Process test keywords
-        for keyword in test.body:
-            if not (hasattr(keyword, 'type') and keyword.type in ['SETUP', 'TEARDOWN']):
-                extract_keywords(keyword, html_lines)
-
-        # Process test teardown
-        if hasattr(test, 'teardown') and test.teardown:
-            html_lines.append("""
-                        <div class="test-case">
-                            <div class="test-name">Test Teardown</div>
-                            <div class="keywords">""")
-            extract_keywords(test.teardown, html_lines, is_teardown=True)
-            html_lines.append("""
-                            </div>
-                        </div>""")
-
-        html_lines.append("""
-                    </div>
-                </div>""")
-
-    # Process suite teardown
-    if hasattr(suite, 'teardown') and suite.teardown:
-        html_lines.append("""
-                <div class="test-case">
-                    <div class="test-name">Suite Teardown</div>
-                    <div class="keywords">""")
-        extract_keywords(suite.teardown, html_lines, is_teardown=True)
-        html_lines.append("""
-                    </div>
-                </div>""")
-
-    html_lines.append("""
+            <div class="suite-content">
+"""
+SUITE_CLOSE = """
             </div>
-        </div>""")
-
-def count_test_cases_and_keywords(suite):
-    """Count total test cases and keywords in a suite and its subsuites."""
-    total_test_cases = len(suite.tests)
-    total_keywords = 0
-
-    # Count keywords in suite setup
-    if suite.setup:
-        total_keywords += 1  # Count the setup itself
-        total_keywords += count_keywords_in_item(suite.setup)
-
-    # Count keywords in suite teardown
-    if suite.teardown:
-        total_keywords += 1  # Count the teardown itself
-        total_keywords += count_keywords_in_item(suite.teardown)
-
-    # Count keywords in test cases
-    for test in suite.tests:
-        # Count test setup
-        if hasattr(test, 'setup') and test.setup:
-            total_keywords += 1  # Count the setup itself
-            total_keywords += count_keywords_in_item(test.setup)
-
-        # Count test keywords
-        for keyword in test.body:
-            total_keywords += 1  # Count the keyword itself
-            total_keywords += count_keywords_in_item(keyword)
-
-        # Count test teardown
-        if hasattr(test, 'teardown') and test.teardown:
-            total_keywords += 1  # Count the teardown itself
-            total_keywords += count_keywords_in_item(test.teardown)
-
-    # Recursively count in subsuites
-    for subsuite in suite.suites:
-        subsuite_tests, subsuite_keywords = count_test_cases_and_keywords(subsuite)
-        total_test_cases += subsuite_tests
-        total_keywords += subsuite_keywords
-
-    return total_test_cases, total_keywords
-
-def count_keywords_in_item(item):
-    """Count keywords in an item (keyword, setup, teardown, etc.)."""
-    count = 0
-    if hasattr(item, 'body'):
-        for nested_item in item.body:
-            count += 1  # Count the nested item itself
-            count += count_keywords_in_item(nested_item)
-    return count
-
-def count_keyword_occurrences(suite):
-    """Count how many times each keyword is executed in a suite and its subsuites."""
-    keyword_counts = {}
-
-    def count_in_item(item):
-        # Skip special types that don't represent actual keywords
-        if hasattr(item, 'type') and item.type in ['FOR', 'IF/ELSE ROOT', 'RETURN', 'FOR ITERATION', 'IF BRANCH']:
-            if hasattr(item, 'body'):
-                for nested_item in item.body:
-                    count_in_item(nested_item)
-            return
-
-        # Only count keywords with user_defined tag
-        if hasattr(item, 'type') and item.type in ['KEYWORD', 'SETUP', 'TEARDOWN']:
-            if hasattr(item, 'kwname'):
-                keyword_name = item.kwname.split('  ')[0]
-                # Skip keywords that start with $
-                if not keyword_name.startswith('$'):
-                    # Check if the keyword has user_defined tag
-                    has_user_defined_tag = False
-                    if hasattr(item, 'tags'):
-                        for tag in item.tags:
-                            if tag.lower() == 'user_defined':
-                                has_user_defined_tag = True
-                                break
-
-                    if has_user_defined_tag:
-                        keyword_counts[keyword_name] = keyword_counts.get(keyword_name, 0) + 1
-
-        # Process nested items
-        if hasattr(item, 'body'):
-            for nested_item in item.body:
-                count_in_item(nested_item)
-
-    # Count in suite setup
-    if suite.setup:
-        count_in_item(suite.setup)
-
-    # Count in suite teardown
-    if suite.teardown:
-        count_in_item(suite.teardown)
-
-    # Count in test cases
-    for test in suite.tests:
-        if hasattr(test, 'setup') and test.setup:
-            count_in_item(test.setup)
-        for keyword in test.body:
-            count_in_item(keyword)
-        if hasattr(test, 'teardown') and test.teardown:
-            count_in_item(test.teardown)
-
-    # Count in subsuites
-    for subsuite in suite.suites:
-        subsuite_counts = count_keyword_occurrences(subsuite)
-        for keyword, count in subsuite_counts.items():
-            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + count
-
-    return keyword_counts
-
-def get_user_defined_keywords(suite):
-    """Get all unique keywords that have the user_defined tag from executed test cases."""
-    keywords = set()
-    visited = set()
-
-    def process_item(item):
-        if id(item) in visited:
-            return
-        visited.add(id(item))
-
-        if hasattr(item, 'type') and item.type in ['KEYWORD', 'SETUP', 'TEARDOWN']:
-            if hasattr(item, 'kwname'):
-                keyword_name = item.kwname.split('  ')[0]
-                if not keyword_name.startswith('$'):
-                    # Check if the keyword has user_defined tag
-                    if hasattr(item, 'tags'):
-                        for tag in item.tags:
-                            if tag.lower() == 'user_defined':
-                                keywords.add(keyword_name)
-                                break
-        # Process nested items (sub-keywords)
-        if hasattr(item, 'body'):
-            for nested_item in item.body:
-                process_item(nested_item)
-
-    # Process suite setup
-    if suite.setup:
-        process_item(suite.setup)
-
-    # Process suite teardown
-    if suite.teardown:
-        process_item(suite.teardown)
-
-    # Process test cases
-    for test in suite.tests:
-        if hasattr(test, 'setup') and test.setup:
-            process_item(test.setup)
-        for keyword in test.body:
-            process_item(keyword)
-        if hasattr(test, 'teardown') and test.teardown:
-            process_item(test.teardown)
-
-    # Process subsuites
-    for subsuite in suite.suites:
-        keywords.update(get_user_defined_keywords(subsuite))
-
-    return sorted(list(keywords))
-
-def create_html_report(suites, total_tests, total_keywords, keyword_stats):
-    html_parts = []
-
-    # Add header and styles
-    html_parts.append("""<!DOCTYPE html>
-<html>
-<head>
-    <title>Test Suite Overview</title>
-    <style>
-        :root {
-            --primary-color: #007AFF;
-            --success-color: #34C759;
-            --warning-color: #FF9500;
-            --error-color: #FF3B30;
-            --text-primary: #1C1C1E;
-            --text-secondary: #3A3A3C;
-            --background-primary: #F2F2F7;
-            --background-secondary: #FFFFFF;
-            --border-color: #E5E5EA;
-            --shadow-color: rgba(0, 0, 0, 0.1);
-        }
-
-        * {
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }
-
-        body {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            line-height: 1.6;
-            color: var(--text-primary);
-            background-color: var(--background-primary);
-            margin: 0;
-            padding: 0;
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 2rem;
-        }
-
-        .main-title {
-            color: var(--text-primary);
-            text-align: center;
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin-bottom: 1rem;
-            letter-spacing: -0.5px;
-        }
-
-        .statistics {
-            text-align: center;
-            margin-bottom: 1rem;
-            font-size: 1.1rem;
-            color: var(--text-secondary);
-        }
-
-        .statistics span {
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-
-        .feedback-section {
-            margin: 20px 0;
-            padding: 20px;
-            border: 1px solid var(--border-color);
-            border-radius: 5px;
-            background-color: var(--background-secondary);
-        }
-
-        .feedback-section h3 {
-            margin-top: 0;
-            color: var(--text-primary);
-        }
-
-        .feedback-section textarea {
-            width: 100%;
-            min-height: 100px;
-            padding: 10px;
-            margin-bottom: 10px;
-            border: 1px solid var(--border-color);
-            border-radius: 4px;
-            font-family: inherit;
-        }
-
-        .button-group {
-            display: flex;
-            gap: 10px;
-            margin: 10px 0;
-        }
-
-        .button-group button {
-            padding: 8px 16px;
-            background-color: #4CAF50;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            transition: background-color 0.3s;
-            font-size: 14px;
-            font-weight: 500;
-        }
-
-        .button-group button:hover {
-            background-color: #45a049;
-        }
-
-        .note {
-            margin: 10px 0;
-            padding: 10px;
-            border-left: 4px solid #4CAF50;
-            background-color: #f9f9f9;
-        }
-
-        .note.implemented {
-            text-decoration: line-through;
-            color: #999;
-        }
-
-        .note .timestamp {
-            font-size: 0.8em;
-            color: #666;
-            margin-top: 5px;
-        }
-
-        .test-suite {
-            background: var(--background-secondary);
-            border-radius: 12px;
-            margin-bottom: 1.5rem;
-            box-shadow: 0 4px 6px var(--shadow-color);
-            overflow: hidden;
-        }
-
-        .suite-header {
-            padding: 1.25rem;
-            background: var(--background-secondary);
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            border-bottom: 1px solid var(--border-color);
-        }
-
-        .suite-name {
-            font-weight: 600;
-            color: var(--text-primary);
-            font-size: 1.1rem;
-        }
-
-        .suite-content {
-            display: none;
-            padding: 1.25rem;
-        }
-
-        .suite-content.visible {
-            display: block;
-        }
-
-        .test-case {
-            padding: 1rem;
-            margin: 0.5rem 0;
-            background: var(--background-primary);
-            border-radius: 8px;
-            cursor: pointer;
-        }
-
-        .test-name {
-            font-weight: 500;
-            color: var(--text-primary);
-        }
-
-        .keywords {
-            display: none;
-            margin-top: 0.75rem;
-        }
-
-        .keywords.visible {
-            display: block;
-        }
-
-        .keywords ul {
-            list-style-type: none;
-            padding-left: 2rem;
-        }
-
-        .keywords li {
-            margin: 0.5rem 0;
-            padding: 0.75rem;
-            background: var(--background-secondary);
-            border-radius: 8px;
-            border-left: 3px solid var(--border-color);
-        }
-
-        .setup-keyword {
-            border-left-color: var(--success-color);
-        }
-
-        .teardown-keyword {
-            border-left-color: var(--error-color);
-        }
-
-        .test-cases-filter {
-            margin: 20px 0;
-            padding: 20px;
-            border: 1px solid var(--border-color);
-            border-radius: 5px;
-            background-color: var(--background-secondary);
-        }
-
-        .filter-header {
-            margin-bottom: 15px;
-        }
-
-        .filter-header input {
-            width: 100%;
-            padding: 8px;
-            border: 1px solid var(--border-color);
-            border-radius: 4px;
-            margin-top: 10px;
-            font-family: inherit;
-        }
-
-        .test-cases-list {
-            max-height: 400px;
-            overflow-y: auto;
-            border: 1px solid var(--border-color);
-            border-radius: 4px;
-        }
-
-        .test-case-item {
-            padding: 8px 12px;
-            border-bottom: 1px solid var(--border-color);
-            font-family: monospace;
-        }
-
-        .test-case-item:last-child {
-            border-bottom: none;
-        }
-
-        .test-case-item:hover {
-            background-color: #f5f5f5;
-        }
-
-        .keyword-item {
-            padding: 8px 12px;
-            border-bottom: 1px solid var(--border-color);
-            font-family: monospace;
-            cursor: pointer;
-        }
-
-        .keyword-item:last-child {
-            border-bottom: none;
-        }
-
-        .keyword-item:hover {
-            background-color: #f5f5f5;
-        }
-
-        .keyword-stats {
-            text-align: center;
-            margin-bottom: 2rem;
-            font-size: 1.1rem;
-            color: var(--text-secondary);
-            cursor: pointer;
-        }
-
-        .keyword-stats:hover {
-            color: var(--primary-color);
-        }
-
-        .keyword-stats-list {
-            display: none;
-            margin-top: 1rem;
-            background: var(--background-secondary);
-            border-radius: 8px;
-            padding: 1rem;
-            max-width: 600px;
-            margin-left: auto;
-            margin-right: auto;
-        }
-
-        .keyword-stats-list.visible {
-            display: block;
-            margin-bottom: 3rem;
-        }
-
-        .keyword-stat-item {
-            display: flex;
-            justify-content: space-between;
-            padding: 0.5rem;
-            border-bottom: 1px solid var(--border-color);
-        }
-
-        .keyword-stat-item:last-child {
-            border-bottom: none;
-        }
-
-        .keyword-name {
-            font-weight: 500;
-        }
-
-        .keyword-count {
-            font-weight: 600;
-            color: var(--primary-color);
-        }
-    </style>
-</head>
-<body>
-    <h1>Test Suite Overview</h1>
-    <p>Total Test Cases: {total_tests} | Total Executed Keywords: {total_keywords}</p>""".format(
-        total_tests=total_tests,
-        total_keywords=total_keywords
-    ))
-
-    # Add feedback section
-    html_parts.append("""
-    <div class="feedback-section">
-        <h2>Feedback Notes</h2>
-        <textarea id="feedbackText" class="feedback-textarea" placeholder="Enter your feedback note here..."></textarea>
-        <button onclick="saveFeedback()" class="feedback-button">Save Note</button>
-        <div id="feedbackNotes" class="feedback-notes"></div>
-    </div>""")
-
-    # Add keyword statistics
-    html_parts.append("""
-    <div class="keyword-stats">
-        <h2>Statistics per Keyword</h2>
-        <button onclick="toggleKeywordStats()" class="toggle-button">Show/Hide Statistics</button>
-        <div id="keywordStats" style="display: none;">
-            <ul>""")
-
-    for keyword, count in keyword_stats.items():
-        html_parts.append(f"                <li>{keyword}: {count} occurrences</li>")
-
-    html_parts.append("""            </ul>
         </div>
-    </div>""")
-
-    # Add suites and test cases
-    html_parts.append("""
-    <div class="suites">""")
-
-    for suite in suites:
-        html_parts.append(f"""
-        <div class="suite">
-            <h2>{suite['name']}</h2>
-            <p>{suite['doc']}</p>
-            <div class="test-cases">""")
-
-        for test in suite['tests']:
-            html_parts.append(f"""
+"""
+BLOCK_OPEN_START = """
                 <div class="test-case">
-                    <h3>{test['name']}</h3>
-                    <p>{test['doc']}</p>
-                    <div class="keywords">""")
-
-            for keyword in test['keywords']:
-                html_parts.append(f"                        {keyword}")
-
-            html_parts.append("""                    </div>
-                </div>""")
-
-        html_parts.append("""            </div>
-        </div>""")
-
-    # Add closing tags and JavaScript
-    html_parts.append(r"""    </div>
-    <script>
-        function toggleKeywordStats() {
-            const stats = document.getElementById('keywordStats');
-            stats.style.display = stats.style.display === 'none' ? 'block' : 'none';
-        }
-
-        function saveFeedback() {
-            const textarea = document.getElementById('feedbackText');
-            const note = textarea.value.trim();
-            if (!note) return;
-
-            // Get existing notes from localStorage or initialize empty array
-            let notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-
-            // Add new note with timestamp
-            notes.push({
-                text: note,
-                timestamp: new Date().toLocaleString()
-            });
-
-            // Save back to localStorage
-            localStorage.setItem('feedbackNotes', JSON.stringify(notes));
-
-            // Clear textarea
-            textarea.value = '';
-
-            // Update displayed notes
-            displayNotes();
-        }
-
-        function displayNotes() {
-            const notesContainer = document.getElementById('feedbackNotes');
-            const notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-
-            notesContainer.innerHTML = notes.map(note => `
-                <div class="feedback-note">
-                    <div class="feedback-text">${note.text}</div>
-                    <div class="feedback-timestamp">${note.timestamp}</div>
+                    <div class="test-name">"""
+# Test case blocks also carry the plain test name for the page script
+TEST_OPEN_START = """
+                <div class="test-case">
+                    <div class="test-name" data-name=\""""
+TEST_OPEN_TITLE = '">Test Case: '
+BLOCK_OPEN_END = """</div>
+                    <div class="keywords">
+"""
+BLOCK_CLOSE = """
+                    </div>
                 </div>
-            `).join('');
-        }
-
-        // Display existing notes when page loads
-        displayNotes();
-    </script>
-</body>
-</html>""")
-
-    return ''.join(html_parts)
-
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python test_suite_overview.py <output.xml>")
-        sys.exit(1)
-
-    output_file = sys.argv[1]
-    result = ExecutionResult(output_file)
-
-    # Count total test cases and keywords
-    total_test_cases, total_keywords = count_test_cases_and_keywords(result.suite)
-
-    # Get unique user-defined keywords
-    user_defined_keywords = get_user_defined_keywords(result.suite)
-
-    # Count keyword occurrences
-    keyword_counts = count_keyword_occurrences(result.suite)
-
-    html_lines = []
-
-    # CSS styles
-    styles = """
+"""
+# Tag lists repeat across the run, so each distinct string is escaped only once
+escape_cached = lru_cache(maxsize=None)(escape)
+
+# Keyword list items, filled in with their class, tags and name; foldable
+# items stay open for their nested list
+KEYWORD_ITEM = "<li class='%s' data-tags='%s'>%s</li>\n"
+KEYWORD_ITEM_FOLD_OPEN = "<li class='%s' data-tags='%s'>%s\n<ul>\n"
+KEYWORD_ITEM_FOLD_CLOSE = "</ul>\n</li>\n"
+
+def minify_css(css):
+    """Drop the comments and redundant whitespace of a style sheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r' ?([{};,>]) ?', r'\1', css)
+    return css.replace(': ', ':').replace(';}', '}').strip()
+
+def strip_indentation(text):
+    """Remove the indentation and blank lines of an inline script block."""
+    return '\n'.join([line.strip() for line in text.splitlines() if line and not line.isspace()])
+
+# Stylesheet shared by the report pages, minified once at import
+REPORT_CSS = minify_css("""
         :root {
             --primary-color: #007AFF;
             --success-color: #34C759;
@@ -1048,24 +398,24 @@ def main():
             font-weight: 600;
             color: var(--primary-color);
         }
-    """
+""")
 
-    # Add header and HTML structure
-    html_lines.append(f"""<!DOCTYPE html>
+# Page head up to the suite tree; filled in with the stylesheet and the totals
+REPORT_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <title>Robot Framework Test Suite Overview</title>
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
     <style>
-{styles}
+%(css)s
     </style>
 </head>
 <body>
     <div class="container">
         <h1 class="main-title">Robot Framework Test Suite Overview</h1>
         <div class="statistics">
-            Total Test Cases: <span>{total_test_cases}</span> | Total Keywords: <span>{total_keywords}</span>
+            Total Test Cases: <span>%(total_tests)d</span> | Total Keywords: <span>%(total_keywords)d</span>
         </div>
 
         <!-- Feedback Section -->
@@ -1102,126 +452,145 @@ def main():
 
         <div class="keyword-stats" onclick="toggleKeywordStats()">
             Click to Show/Hide Keyword Statistics
-            <div class="keyword-stats-list" id="keywordStatsList">
-                {
-                    ''.join(
-                        f'<div class="keyword-stat-item"><span class="keyword-name">{keyword}</span><span class="keyword-count">{count}</span></div>'
-                        for keyword, count in sorted(keyword_counts.items())
-                    )
-                }
-            </div>
+            <div class="keyword-stats-list" id="keywordStatsList"></div>
         </div>
-        <div class="test-suites">""")
+        <div class="test-suites">"""
 
-    # Process suites
-    process_suite(result.suite, html_lines)
-
-    # Add closing tags and JavaScript
-    html_lines.append(f"""
+# Closing markup and page script, filled in with the JSON data; the
+# indentation is stripped once at import
+REPORT_SCRIPT = strip_indentation("""
         </div>
     </div>
     <script>
         // Store the user-defined keywords
-        const userDefinedKeywords = {json.dumps(user_defined_keywords)};
+        const userDefinedKeywords = %(user_defined_keywords)s;
+        // Store their lowercased form for the keyword filter
+        const userDefinedKeywordsLower = %(user_defined_keywords_lower)s;
+        // Store the full suite.test paths of all test cases
+        const allTestCases = %(test_paths)s;
+        // Store the [name, count] statistics, with the names already HTML-escaped
+        const keywordStats = %(keyword_stats)s;
+        // Feedback notes are read from localStorage once and written back on every change
+        let feedbackNotes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
+
+        function storeNotes() {
+            localStorage.setItem('feedbackNotes', JSON.stringify(feedbackNotes));
+        }
 
-        function toggleKeywordStats() {{
+        function escapeHtml(text) {
+            // Names from the JSON data are plain text, escape them before using them as HTML
+            return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+                .replace(/"/g, '&quot;').replace(/'/g, '&#39;');
+        }
+
+        function toggleKeywordStats() {
             const statsList = document.getElementById('keywordStatsList');
+            // Build the statistics rows the first time they are shown
+            if (!statsList.dataset.ready) {
+                statsList.innerHTML = keywordStats.map(([keyword, count]) =>
+                    `<div class="keyword-stat-item"><span class="keyword-name">${keyword}</span><span class="keyword-count">${count}</span></div>`
+                ).join('');
+                statsList.dataset.ready = 'true';
+            }
             statsList.classList.toggle('visible');
-        }}
+        }
 
-        function saveFeedback() {{
+        function saveFeedback() {
             const textarea = document.getElementById('feedbackText');
             const note = textarea.value.trim();
             if (!note) return;
 
-            // Get existing notes from localStorage or initialize empty array
-            let notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-
             // Add new note with timestamp and implementation status
-            notes.push({{
+            feedbackNotes.push({
                 text: note,
                 timestamp: new Date().toLocaleString(),
                 implemented: false
-            }});
+            });
 
             // Save back to localStorage
-            localStorage.setItem('feedbackNotes', JSON.stringify(notes));
+            storeNotes();
 
             // Clear textarea
             textarea.value = '';
 
             // Update displayed notes
             displayNotes();
-        }}
+        }
 
-        function toggleImplementation(index) {{
-            const notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-            notes[index].implemented = !notes[index].implemented;
-            localStorage.setItem('feedbackNotes', JSON.stringify(notes));
-            displayNotes();
-        }}
+        function toggleImplementation(index) {
+            const note = feedbackNotes[index];
+            note.implemented = !note.implemented;
+            storeNotes();
+
+            // Update only this note instead of redrawing the list
+            const noteElement = document.querySelector(`.note:nth-child(${index + 1})`);
+            noteElement.classList.toggle('implemented', note.implemented);
+            noteElement.querySelector('input[type="checkbox"]').checked = note.implemented;
+        }
 
-        function editNote(index) {{
-            const notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-            const note = notes[index];
-            const noteElement = document.querySelector(`.note:nth-child(${{index + 1}})`);
+        function editNote(index) {
+            const note = feedbackNotes[index];
+            const noteElement = document.querySelector(`.note:nth-child(${index + 1})`);
 
             // Create edit form
             const editForm = document.createElement('div');
             editForm.className = 'note-edit';
             editForm.innerHTML = `
-                <textarea class="edit-textarea">${{note.text}}</textarea>
+                <textarea class="edit-textarea">${note.text}</textarea>
                 <div class="edit-buttons">
-                    <button onclick="saveEdit(${{index}})">Save</button>
-                    <button onclick="cancelEdit(${{index}})">Cancel</button>
+                    <button onclick="saveEdit(${index})">Save</button>
+                    <button onclick="cancelEdit(${index})">Cancel</button>
                 </div>
             `;
 
             // Replace note content with edit form
             noteElement.querySelector('.note-content').style.display = 'none';
             noteElement.appendChild(editForm);
-        }}
+        }
 
-        function saveEdit(index) {{
-            const notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-            const noteElement = document.querySelector(`.note:nth-child(${{index + 1}})`);
+        function saveEdit(index) {
+            const noteElement = document.querySelector(`.note:nth-child(${index + 1})`);
             const editTextarea = noteElement.querySelector('.edit-textarea');
 
             // Update note text
-            notes[index].text = editTextarea.value.trim();
-            localStorage.setItem('feedbackNotes', JSON.stringify(notes));
+            feedbackNotes[index].text = editTextarea.value.trim();
+            storeNotes();
 
-            // Refresh display
-            displayNotes();
-        }}
+            // Refresh only this note's text
+            noteElement.querySelector('.note-text').innerHTML = feedbackNotes[index].text;
+            closeEditForm(noteElement);
+        }
 
-        function cancelEdit(index) {{
-            displayNotes();
-        }}
+        function cancelEdit(index) {
+            closeEditForm(document.querySelector(`.note:nth-child(${index + 1})`));
+        }
 
-        function displayNotes() {{
-            const notesContainer = document.getElementById('savedNotes');
-            const notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
+        function closeEditForm(noteElement) {
+            // Remove the edit form and show the note content again
+            noteElement.querySelector('.note-edit').remove();
+            noteElement.querySelector('.note-content').style.display = '';
+        }
 
-            notesContainer.innerHTML = notes.map((note, index) => `
-                <div class="note ${{note.implemented ? 'implemented' : ''}}">
+        function displayNotes() {
+            const notesContainer = document.getElementById('savedNotes');
+            notesContainer.innerHTML = feedbackNotes.map((note, index) => `
+                <div class="note ${note.implemented ? 'implemented' : ''}">
                     <input type="checkbox"
-                           ${{note.implemented ? 'checked' : ''}}
-                           onchange="toggleImplementation(${{index}})">
+                           ${note.implemented ? 'checked' : ''}
+                           onchange="toggleImplementation(${index})">
                     <div class="note-content">
-                        <div class="note-text">${{note.text}}</div>
+                        <div class="note-text">${note.text}</div>
                         <div class="note-actions">
-                            <button onclick="editNote(${{index}})" class="edit-button">Edit</button>
+                            <button onclick="editNote(${index})" class="edit-button">Edit</button>
                         </div>
-                        <div class="timestamp">${{note.timestamp}}</div>
+                        <div class="timestamp">${note.timestamp}</div>
                     </div>
                 </div>
             `).join('');
-        }}
+        }
 
-        function backupNotes() {{
-            const notes = JSON.parse(localStorage.getItem('feedbackNotes') || '[]');
-            const blob = new Blob([JSON.stringify(notes, null, 2)], {{type: 'application/json'}});
+        function backupNotes() {
+            const blob = new Blob([JSON.stringify(feedbackNotes, null, 2)], {type: 'application/json'});
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
@@ -1230,148 +599,155 @@ def main():
             a.click();
             document.body.removeChild(a);
             URL.revokeObjectURL(url);
-        }}
+        }
 
-        function restoreNotes() {{
+        function restoreNotes() {
             const input = document.createElement('input');
             input.type = 'file';
             input.accept = '.json';
-            input.onchange = function(e) {{
+            input.onchange = function(e) {
                 const file = e.target.files[0];
-                if (file) {{
+                if (file) {
                     const reader = new FileReader();
-                    reader.onload = function(e) {{
-                        try {{
-                            const notes = JSON.parse(e.target.result);
-                            localStorage.setItem('feedbackNotes', JSON.stringify(notes));
+                    reader.onload = function(e) {
+                        try {
+                            feedbackNotes = JSON.parse(e.target.result);
+                            storeNotes();
                             displayNotes();
                             alert('Notes restored successfully!');
-                        }} catch (error) {{
+                        } catch (error) {
                             alert('Error restoring notes: Invalid JSON file');
-                        }}
-                    }};
+                        }
+                    };
                     reader.readAsText(file);
-                }}
-            }};
+                }
+            };
             input.click();
-        }}
+        }
 
-        function toggleTestCasesFilter() {{
+        function toggleTestCasesFilter() {
             const filterSection = document.getElementById('testCasesFilter');
-            if (filterSection.style.display === 'none') {{
+            if (filterSection.style.display === 'none') {
                 filterSection.style.display = 'block';
                 populateTestCasesList();
-            }} else {{
+            } else {
                 filterSection.style.display = 'none';
-            }}
-        }}
+            }
+        }
 
-        function populateTestCasesList() {{
-            const testCasesList = document.getElementById('testCasesList');
-            const testCasesSet = new Set(); // Use Set to ensure uniqueness
+        function populateTestCasesList() {
+            // Store test cases in a global variable for filtering, along with
+            // their lowercased form so a search does not lowercase every entry
+            window.allTestCases = allTestCases;
+            if (!window.allTestCasesLower) {
+                window.allTestCasesLower = allTestCases.map(testCase => testCase.toLowerCase());
+            }
 
-            // Collect all test cases with their full paths
-            document.querySelectorAll('.test-suite').forEach(suite => {{
-                // Only process leaf suites (those that contain test cases directly)
-                const hasDirectTestCases = suite.querySelector('.test-case') !== null;
-                const hasSubSuites = suite.querySelector('.test-suite') !== null;
+            // Display all test cases initially
+            displayFilteredTestCases(allTestCases);
+        }
 
-                if (hasDirectTestCases && !hasSubSuites) {{
-                    const suitePath = getFullSuitePath(suite);
-                    suite.querySelectorAll('.test-case').forEach(testCase => {{
-                        const testName = testCase.querySelector('.test-name').textContent.replace('Test Case: ', '');
-                        // Skip setup and teardown entries
-                        if (!testName.toLowerCase().includes('setup') && !testName.toLowerCase().includes('teardown')) {{
-                            const fullPath = `${{suitePath}}.${{testName}}`;
-                            testCasesSet.add(fullPath); // Set automatically handles duplicates
-                        }}
-                    }});
-                }}
-            }});
-
-            // Convert Set to Array and sort
-            const sortedTestCases = Array.from(testCasesSet).sort();
-
-            // Store test cases in a global variable for filtering
-            window.allTestCases = sortedTestCases;
+        function getFullSuitePath(suiteElement) {
+            // The path is stored on the suite element after the first lookup
+            const cachedPath = suiteElement.dataset.fullPath;
+            if (cachedPath !== undefined) {
+                return cachedPath;
+            }
 
-            // Display all test cases initially
-            displayFilteredTestCases(sortedTestCases);
-        }}
-
-        function getFullSuitePath(suiteElement) {{
-            const pathParts = [];
-            let currentElement = suiteElement;
-
-            // Traverse up to build the full path
-            while (currentElement) {{
-                const suiteName = currentElement.querySelector('.suite-name');
-                if (suiteName) {{
-                    pathParts.unshift(suiteName.textContent.replace('Suite: ', ''));
-                }}
-                // Move up to parent suite if it exists
-                currentElement = currentElement.closest('.test-suite')?.parentElement?.closest('.test-suite');
-            }}
-
-            return pathParts.join('.');
-        }}
-
-        function filterTestCases() {{
+            // Build the path from the parent suite's path, which is cached in turn
+            // Every suite name is rendered behind the same 'Suite: ' prefix
+            const suiteName = suiteElement.querySelector('.suite-name').textContent.slice('Suite: '.length);
+            const parentSuite = suiteElement.parentElement?.closest('.test-suite');
+            const fullPath = parentSuite ? `${getFullSuitePath(parentSuite)}.${suiteName}` : suiteName;
+            suiteElement.dataset.fullPath = fullPath;
+            return fullPath;
+        }
+
+        function debounce(callback, delay) {
+            // Run callback once input has been idle for delay milliseconds
+            let timer;
+            return () => {
+                clearTimeout(timer);
+                timer = setTimeout(callback, delay);
+            };
+        }
+
+        // The filters rebuild their whole list, so wait for a pause in typing
+        const filterTestCases = debounce(applyTestCasesFilter, 50);
+        const filterKeywords = debounce(applyKeywordsFilter, 50);
+
+        function applyTestCasesFilter() {
             const searchText = document.getElementById('testCaseSearch').value.toLowerCase();
-            const filteredCases = Array.from(window.allTestCases).filter(testCase =>
-                testCase.toLowerCase().includes(searchText)
-            );
+            const testCasesLower = window.allTestCasesLower;
+            const filteredCases = [];
+            for (let i = 0; i < testCasesLower.length; i++) {
+                if (testCasesLower[i].includes(searchText)) {
+                    filteredCases.push(window.allTestCases[i]);
+                }
+            }
             displayFilteredTestCases(filteredCases);
-        }}
+        }
 
-        function displayFilteredTestCases(testCases) {{
+        function displayFilteredTestCases(testCases) {
             const testCasesList = document.getElementById('testCasesList');
             testCasesList.innerHTML = testCases.map(testCase => `
-                <div class="test-case-item" onclick="scrollToTestCase('${{testCase}}')">
-                    ${{testCase}}
+                <div class="test-case-item" data-path="${escapeHtml(testCase)}">
+                    ${escapeHtml(testCase)}
                 </div>
             `).join('');
-        }}
+        }
+
+        function getSuiteMap() {
+            // Index the suites by full path once, keeping the first suite for each path
+            if (!window.suiteMap) {
+                window.suiteMap = new Map();
+                document.querySelectorAll('.test-suite').forEach(suite => {
+                    const suitePath = getFullSuitePath(suite);
+                    if (!window.suiteMap.has(suitePath)) {
+                        window.suiteMap.set(suitePath, suite);
+                    }
+                });
+            }
+            return window.suiteMap;
+        }
 
-        function scrollToTestCase(testCasePath) {{
+        function scrollToTestCase(testCasePath) {
             const pathParts = testCasePath.split('.');
             const testName = pathParts.pop(); // Last part is the test name
             const suitePath = pathParts.join('.'); // Rest is the suite path
 
-            // Find the suite by matching the full path
-            const suite = Array.from(document.querySelectorAll('.test-suite')).find(s =>
-                getFullSuitePath(s) === suitePath
-            );
+            // Find the suite by its full path
+            const suite = getSuiteMap().get(suitePath);
 
-            if (suite) {{
+            if (suite) {
                 const testCase = Array.from(suite.querySelectorAll('.test-case')).find(t =>
-                    t.querySelector('.test-name').textContent.includes(testName)
+                    t.firstElementChild.dataset.name === testName
                 );
-                if (testCase) {{
+                if (testCase) {
                     // Expand the suite if it's collapsed
                     suite.querySelector('.suite-content').classList.add('visible');
                     // Scroll to the test case
-                    testCase.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
+                    testCase.scrollIntoView({ behavior: 'smooth', block: 'center' });
                     // Highlight the test case briefly
                     testCase.style.backgroundColor = '#fff3cd';
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         testCase.style.backgroundColor = '';
-                    }}, 2000);
-                }}
-            }}
-        }}
+                    }, 2000);
+                }
+            }
+        }
 
-        function toggleKeywordsFilter() {{
+        function toggleKeywordsFilter() {
             const filterSection = document.getElementById('keywordsFilter');
-            if (filterSection.style.display === 'none') {{
+            if (filterSection.style.display === 'none') {
                 filterSection.style.display = 'block';
                 populateKeywordsList();
-            }} else {{
+            } else {
                 filterSection.style.display = 'none';
-            }}
-        }}
+            }
+        }
 
-        function populateKeywordsList() {{
+        function populateKeywordsList() {
             const keywordsList = document.getElementById('keywordsList');
 
             // Store keywords in a global variable for filtering
@@ -1379,65 +755,98 @@ def main():
 
             // Display all keywords initially
             displayFilteredKeywords(userDefinedKeywords);
-        }}
+        }
 
-        function filterKeywords() {{
+        function applyKeywordsFilter() {
             const searchText = document.getElementById('keywordSearch').value.toLowerCase();
-            const filteredKeywords = window.allKeywords.filter(keyword =>
-                keyword.toLowerCase().includes(searchText)
-            );
+            const filteredKeywords = [];
+            for (let i = 0; i < userDefinedKeywordsLower.length; i++) {
+                if (userDefinedKeywordsLower[i].includes(searchText)) {
+                    filteredKeywords.push(window.allKeywords[i]);
+                }
+            }
             displayFilteredKeywords(filteredKeywords);
-        }}
+        }
 
-        function displayFilteredKeywords(keywords) {{
+        function displayFilteredKeywords(keywords) {
             const keywordsList = document.getElementById('keywordsList');
             keywordsList.innerHTML = keywords.map(keyword => `
-                <div class="keyword-item" onclick="scrollToKeyword('${{keyword}}')">
-                    ${{keyword}}
+                <div class="keyword-item" data-keyword="${escapeHtml(keyword)}">
+                    ${escapeHtml(keyword)}
                 </div>
             `).join('');
-        }}
+        }
 
-        function scrollToKeyword(keywordName) {{
+        function getKeywordMap() {
+            // Index the keyword items by their text once, keeping the first occurrence
+            if (!window.keywordMap) {
+                window.keywordMap = new Map();
+                document.querySelectorAll('.keywords li').forEach(li => {
+                    const keywordText = li.textContent.trim();
+                    if (!window.keywordMap.has(keywordText)) {
+                        window.keywordMap.set(keywordText, li);
+                    }
+                });
+            }
+            return window.keywordMap;
+        }
+
+        function scrollToKeyword(keywordName) {
             // Find the first occurrence of the keyword
-            const keywordElement = Array.from(document.querySelectorAll('.keywords li')).find(
-                li => li.textContent.trim() === keywordName
-            );
+            const keywordElement = getKeywordMap().get(keywordName);
 
-            if (keywordElement) {{
+            if (keywordElement) {
                 // Find the parent test case
                 const testCase = keywordElement.closest('.test-case');
-                if (testCase) {{
+                if (testCase) {
                     // Find the parent suite
                     const suite = testCase.closest('.test-suite');
-                    if (suite) {{
+                    if (suite) {
                         // Expand the suite if it's collapsed
                         suite.querySelector('.suite-content').classList.add('visible');
                         // Expand the test case if it's collapsed
                         testCase.querySelector('.keywords').classList.add('visible');
                         // Scroll to the keyword
-                        keywordElement.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
+                        keywordElement.scrollIntoView({ behavior: 'smooth', block: 'center' });
                         // Highlight the keyword briefly
                         keywordElement.style.backgroundColor = '#fff3cd';
-                        setTimeout(() => {{
+                        setTimeout(() => {
                             keywordElement.style.backgroundColor = '';
-                        }}, 2000);
-                    }}
-                }}
-            }}
-        }}
-
-        document.querySelectorAll('.test-suite').forEach(suite => {{
-            suite.querySelector('.suite-header').addEventListener('click', () => {{
-                suite.querySelector('.suite-content').classList.toggle('visible');
-            }});
-        }});
-
-        document.querySelectorAll('.test-case').forEach(testCase => {{
-            testCase.addEventListener('click', () => {{
+                        }, 2000);
+                    }
+                }
+            }
+        }
+
+        // One click handler per filter list instead of an inline handler per row
+        document.getElementById('testCasesList').addEventListener('click', event => {
+            const item = event.target.closest('.test-case-item');
+            if (item) {
+                scrollToTestCase(item.dataset.path);
+            }
+        });
+
+        document.getElementById('keywordsList').addEventListener('click', event => {
+            const item = event.target.closest('.keyword-item');
+            if (item) {
+                scrollToKeyword(item.dataset.keyword);
+            }
+        });
+
+        // Expand and collapse suites and test cases through one listener on the body
+        document.body.addEventListener('click', event => {
+            const header = event.target.closest('.suite-header');
+            if (header) {
+                header.closest('.test-suite').querySelector('.suite-content').classList.toggle('visible');
+            }
+
+            // Fixture blocks are nested in their test case, and a click toggles every block around it
+            let testCase = event.target.closest('.test-case');
+            while (testCase) {
                 testCase.querySelector('.keywords').classList.toggle('visible');
-            }});
-        }});
+                testCase = testCase.parentElement.closest('.test-case');
+            }
+        });
 
         // Display existing notes when page loads
         displayNotes();
@@ -1445,9 +854,336 @@ def main():
 </body>
 </html>""")
 
+def script_json(value):
+    """Serialize value as JSON that can be embedded in a <script> block."""
+    return json.dumps(value).replace('<', '\\u003c').replace('>', '\\u003e').replace('&', '\\u0026')
+
+def report_cache_key(output_file):
+    """Hash the output XML together with this script, so report changes invalidate the cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (__file__, output_file):
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def copy_file_atomically(src, dst):
+    """Copy src to dst through a temporary file, returning whether the copy succeeded.
+
+    The temporary file is renamed over dst, so dst is never left half-written.
+    """
+    temp_file = f'{dst}.{os.getpid()}.tmp'
+    try:
+        with open(src, 'rb') as f, open(temp_file, 'wb') as out:
+            shutil.copyfileobj(f, out, 1 << 20)
+        os.replace(temp_file, dst)
+        return True
+    except OSError:
+        return False
+    finally:
+        # Nothing is left to remove once the rename has succeeded
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+def load_cached_report(cache_file, report_file):
+    """Copy a cached report into place, returning whether there was a usable one.
+
+    An entry that cannot be read, for example because another run has just
+    evicted it, counts as a miss.
+    """
+    if not copy_file_atomically(cache_file, report_file):
+        return False
+    # Mark the entry as recently used
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return True
+
+def store_cached_report(report_file, cache_file):
+    """Copy a report into the cache and drop the least recently used entries.
+
+    A cache location that cannot be written is not an error.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+    except OSError:
+        return
+    if not copy_file_atomically(report_file, cache_file):
+        return
+
+    # Cache hits refresh the modification time, so it orders entries by last use.
+    # Temporary files are only left behind by runs killed in the middle of a copy.
+    stale_before = time.time() - 3600
+    try:
+        entries = []
+        for entry in os.scandir(CACHE_DIR):
+            if entry.name.endswith('.html'):
+                entries.append(entry)
+            elif entry.name.endswith('.tmp') and entry.stat().st_mtime < stale_before:
+                os.remove(entry.path)
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[CACHE_MAX_ENTRIES:]:
+            os.remove(entry.path)
+    except OSError:
+        pass
+
+class ResultNode:
+    """Lightweight stand-in for the Robot Framework result objects read by the report."""
+    __slots__ = ('type', 'name', 'status', 'tags', 'user_defined', 'body', 'setup', 'teardown')
+
+    def __init__(self, node_type, name=''):
+        self.type = node_type
+        self.name = name
+        self.status = None
+        self.tags = []
+        self.user_defined = False
+        self.body = []
+        self.setup = None
+        self.teardown = None
+
+    @property
+    def kwname(self):
+        return self.name
+
+@lru_cache(maxsize=None)
+def keyword_label(keyword_name):
+    """Return the short name of a keyword and its HTML-escaped form."""
+    short_name = keyword_name.partition(NAME_SEPARATOR)[0]
+    return short_name, escape(short_name)
+
+def extract_keywords(item, write, stats, keyword_class="", emit=True):
+    """Extract keywords from an item, handling nested structures.
+
+    Every item in the tree is also counted in stats, including the ones
+    that are not shown in the report, and the names of user-defined
+    keywords are collected.
+    """
+    keyword_counts = stats["counts"]
+    user_defined = stats["user_defined"]
+    keyword_total = 0
+
+    # Walk the tree with an explicit stack of (item, closing_html, emit)
+    # entries; entries without an item emit their closing HTML when popped.
+    # emit is cleared below skipped items, which are still counted.
+    stack = [(item, None, emit)]
+    while stack:
+        item, closing_html, emit = stack.pop()
+        if item is None:
+            write(closing_html)
+            continue
+
+        keyword_total += 1
+
+        # Every item is a ResultNode, so its slots can be read directly;
+        # look up the ones used below once per item
+        item_type = item.type
+        body = item.body
+
+        # Skip items marked as NOT RUN
+        if item.status == NOT_RUN:
+            emit = False
+
+        foldable = False
+
+        # Handle all keywords, including setup and teardown
+        if item_type in KEYWORD_TYPES:
+            keyword_name = item.kwname
+
+            if not keyword_name or keyword_name.startswith('$') or not item.user_defined:
+                emit = False
+            else:
+                # Use the complete keyword name; the short and escaped forms are
+                # computed once per distinct name
+                short_name, keyword_name = keyword_label(keyword_name)
+                keyword_counts[keyword_name] += 1
+                user_defined.add(short_name)
+
+                if emit:
+                    # Keywords with nested keywords are foldable, others are simple list items
+                    foldable = bool(body)
+                    write((KEYWORD_ITEM_FOLD_OPEN if foldable else KEYWORD_ITEM)
+                          % (keyword_class, escape_cached(' '.join(item.tags)), keyword_name))
+
+        # Process nested items once, inside the list of a foldable keyword;
+        # children are pushed in reverse to keep document order
+        if foldable:
+            stack.append((None, KEYWORD_ITEM_FOLD_CLOSE, True))
+        if body:
+            stack.extend((nested_item, None, emit) for nested_item in reversed(body))
+
+    stats["keywords"] += keyword_total
+
+def process_fixture(fixture, title, write, stats, keyword_class=""):
+    """Process a suite or test setup/teardown block."""
+    write(BLOCK_OPEN_START)
+    write(title)
+    write(BLOCK_OPEN_END)
+    extract_keywords(fixture, write, stats, keyword_class=keyword_class)
+    write(BLOCK_CLOSE)
+
+def process_test(test, suite_name, suite_path, write, stats, processed_tests):
+    """Process a test case, updating the totals and test paths in stats."""
+    stats["tests"] += 1
+
+    # A test already shown for this suite name is still counted, but not shown again
+    test_id = f"{suite_name}.{test.name}"
+    if test_id in processed_tests:
+        for item in (test.setup, *test.body, test.teardown):
+            if item:
+                extract_keywords(item, write, stats, emit=False)
+        return
+    processed_tests.add(test_id)
+    stats["test_paths"].append(f"{suite_path}.{test.name}")
+
+    test_name = escape(test.name)
+    write(TEST_OPEN_START)
+    write(test_name)
+    write(TEST_OPEN_TITLE)
+    write(test_name)
+    write(BLOCK_OPEN_END)
+
+    # Process test setup
+    if test.setup:
+        process_fixture(test.setup, "Test Setup", write, stats, "setup-keyword")
+
+    # Process test keywords
+    for keyword in test.body:
+        extract_keywords(keyword, write, stats)
+
+    # Process test teardown
+    if test.teardown:
+        process_fixture(test.teardown, "Test Teardown", write, stats, "teardown-keyword")
+
+    write(BLOCK_CLOSE)
+
+def process_output(output_file, write, stats):
+    """Process the suites of output.xml while streaming it, updating the totals in stats.
+
+    Only the test or suite fixture being read is kept in memory; it is
+    written out as soon as its closing tag is parsed and every XML element
+    is cleared once read. A suite is opened in the HTML when its first test
+    or fixture is written, so suites without any are left out.
+    """
+    suites = []  # [name, opened] for each suite being read
+    processed_tests = set()
+    stack = []
+    for event, elem in iterparse(output_file, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == 'suite':
+                suites.append([elem.get('name', ''), False])
+                continue
+            if not suites:
+                continue
+            if tag == 'test':
+                node = ResultNode('TEST', elem.get('name', ''))
+            elif tag == 'kw':
+                node = ResultNode(elem.get('type', 'KEYWORD'), elem.get('name', ''))
+            elif tag == 'branch':
+                node = ResultNode(elem.get('type', ''))
+            elif tag in BODY_ELEMENT_TYPES:
+                node = ResultNode(BODY_ELEMENT_TYPES[tag])
+            else:
+                continue
+            stack.append(node)
+            continue
+
+        if tag == 'suite':
+            if suites.pop()[1]:
+                write(SUITE_CLOSE)
+            if not suites:
+                # The rest of the file only holds statistics and errors
+                break
+        elif not stack:
+            # Suite documentation, metadata and status are not used
+            pass
+        elif tag == 'status':
+            stack[-1].status = elem.get('status')
+        elif tag == 'tag':
+            # Check for the user_defined tag once, while reading it
+            tag_name = elem.text or ''
+            stack[-1].tags.append(tag_name)
+            if tag_name.lower() == USER_DEFINED_TAG:
+                stack[-1].user_defined = True
+        elif tag in ('test', 'kw', 'branch') or tag in BODY_ELEMENT_TYPES:
+            node = stack.pop()
+            if node.type == 'SETUP' and stack:
+                stack[-1].setup = node
+            elif node.type == 'TEARDOWN' and stack:
+                stack[-1].teardown = node
+            elif stack:
+                stack[-1].body.append(node)
+            else:
+                # A test or suite fixture is complete; open the enclosing suites first
+                for suite in suites:
+                    if not suite[1]:
+                        write(SUITE_OPEN_START)
+                        write(escape(suite[0]))
+                        write(SUITE_OPEN_END)
+                        suite[1] = True
+                if node.type == 'TEST':
+                    suite_path = '.'.join([suite[0] for suite in suites])
+                    process_test(node, suites[-1][0], suite_path, write, stats, processed_tests)
+                elif node.type == 'SETUP':
+                    process_fixture(node, "Suite Setup", write, stats, "setup-keyword")
+                else:
+                    process_fixture(node, "Suite Teardown", write, stats, "teardown-keyword")
+        elem.clear()
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python test_suite_overview.py <output.xml>")
+        sys.exit(1)
+
+    output_file = sys.argv[1]
+
+    # Reuse a previously generated report for identical output XML
+    use_cache = not os.environ.get(NO_CACHE_ENV)
+    if use_cache:
+        cache_file = os.path.join(CACHE_DIR, report_cache_key(output_file) + '.html')
+        if load_cached_report(cache_file, OUTPUT_HTML):
+            return
+
+    # Process suites, counting test cases and keywords along the way
+    stats = {"tests": 0, "keywords": 0, "counts": Counter(), "user_defined": set(), "test_paths": []}
+    # The suite HTML is buffered because the header needs the totals first
+    suites_html = io.StringIO()
+    process_output(output_file, suites_html.write, stats)
+    total_test_cases = stats["tests"]
+    total_keywords = stats["keywords"]
+    keyword_counts = stats["counts"]
+    user_defined_keywords = sorted(stats["user_defined"])
+    user_defined_keywords_lower = [keyword.lower() for keyword in user_defined_keywords]
+    test_paths = sorted(stats["test_paths"])
+
+    # Collect the keyword statistics; the rows are built in the page on first display.
+    # Sort the names alone; they are unique, so no (name, count) tuples are compared
+    keyword_stats = [[keyword, keyword_counts[keyword]] for keyword in sorted(keyword_counts)]
+
+    # Add header and HTML structure
+    header = REPORT_HEAD % {"css": REPORT_CSS, "total_tests": total_test_cases, "total_keywords": total_keywords}
+
+    # Add closing tags and JavaScript
+    footer = REPORT_SCRIPT % {
+        "user_defined_keywords": script_json(user_defined_keywords),
+        "user_defined_keywords_lower": script_json(user_defined_keywords_lower),
+        "test_paths": script_json(test_paths),
+        "keyword_stats": script_json(keyword_stats),
+    }
+
     # Write the HTML file
-    with open('test_suite_overview.html', 'w', encoding='utf-8') as f:
-        f.write('\n'.join(html_lines))
+    with open(OUTPUT_HTML, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(header)
+        f.write('\n')
+        f.write(suites_html.getvalue())
+        f.write(footer)
+
+    # Store the report in the cache
+    if use_cache:
+        store_cached_report(OUTPUT_HTML, cache_file)
 
 if __name__ == "__main__":
     main()
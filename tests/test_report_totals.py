@@ -0,0 +1,54 @@
+"""Check the report totals for a recorded run against the ExecutionResult based implementation."""
+import html
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(os.path.dirname(TESTS_DIR), 'robot_test_report.py')
+# Robot Framework run with nested suites, fixtures, NOT RUN keywords and two
+# suites named Login holding the same test
+OUTPUT_XML = os.path.join(TESTS_DIR, 'data', 'output.xml')
+
+# Values reported for OUTPUT_XML by the script before it parsed output.xml itself
+EXPECTED_TESTS = 11
+EXPECTED_KEYWORDS = 252
+EXPECTED_KEYWORD_COUNTS = {
+    'Clean Env': 3,
+    'Clean Test': 3,
+    'Do Login': 2,
+    'Do Thing': 33,
+    'Inner <Kw>': 9,
+    'Nested Thing': 9,
+    'Prepare Env': 3,
+    'Prepare Test': 3,
+}
+
+def read_keyword_counts(report):
+    """Return the keywordStats data of a report as a name to count dict."""
+    stats = json.loads(re.search(r'const keywordStats = (.*);', report).group(1))
+    return {html.unescape(name): count for name, count in stats}
+
+class ReportTotalsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        env = dict(os.environ, RBF_REPORT_NO_CACHE='1')
+        with tempfile.TemporaryDirectory() as work_dir:
+            subprocess.run([sys.executable, SCRIPT, OUTPUT_XML], cwd=work_dir, env=env, check=True)
+            with open(os.path.join(work_dir, 'test_suite_overview.html'), encoding='utf-8') as f:
+                cls.report = f.read()
+
+    def test_totals(self):
+        match = re.search(r'Total Test Cases: <span>(\d+)</span> \| Total Keywords: <span>(\d+)</span>', self.report)
+        self.assertIsNotNone(match)
+        self.assertEqual((int(match.group(1)), int(match.group(2))), (EXPECTED_TESTS, EXPECTED_KEYWORDS))
+
+    def test_keyword_counts(self):
+        self.assertEqual(read_keyword_counts(self.report), EXPECTED_KEYWORD_COUNTS)
+
+if __name__ == '__main__':
+    unittest.main()